@@ -144,48 +144,131 @@
 #     app.run(debug=True)
 
 
-from flask import Flask, jsonify, render_template_string, request
+from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from markupsafe import Markup, escape
+import orjson
 import requests
-from datetime import datetime
-from skyfield.api import load, EarthSatellite
+from requests.adapters import HTTPAdapter
+import threading
+import time
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from skyfield.sgp4lib import theta_GMST1982
+from sgp4.api import Satrec, SatrecArray, jday
+from segment1 import teme_to_subpoint
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson's C implementation."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # URL to fetch TLE data
 TLE_URL = "https://celestrak.org/NORAD/elements/gp.php?GROUP=visual&FORMAT=tle"
 
-# Satellite data and timescale
-satellites = {}
-ts = load.timescale()
+# CelesTrak only updates GP data every couple of hours
+TLE_REFRESH_INTERVAL = timedelta(hours=2)
+
+# Keep-alive connection pool reused across refreshes, so a refresh skips
+# the TCP/TLS handshake and the gzip-compressed TLE list is negotiated
+session = requests.Session()
+session.headers.update({'Accept-Encoding': 'gzip', 'User-Agent': 'Earth_Sat/1.0'})
+session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Satellite catalog. load_tle_data swaps in a whole new catalog with one
+# assignment, so requests never see the SatrecArray, name index and
+# <select> options out of step with each other.
+catalog = {'array': None, 'index': {}, 'options_html': Markup('')}
+
+# Satrec objects from the previous load keyed by (line1, line2), so a
+# refresh only runs SGP4 initialization for TLEs that actually changed
+satrec_by_tle = {}
+
+# Latest batched propagation as a (catalog, second, positions) tuple
+position_cache = {'entry': None}
 
 
 def load_tle_data():
     """Load TLE data from the internet and store satellite objects."""
-    global satellites
+    global catalog, satrec_by_tle
     try:
-        response = requests.get(TLE_URL)
+        response = session.get(TLE_URL, timeout=(3, 10))
         response.raise_for_status()
         tle_lines = response.text.splitlines()
 
-        satellites.clear()
-        for i in range(0, len(tle_lines), 3):
-            if i + 2 >= len(tle_lines):
-                break
-            name = tle_lines[i].strip()
-            line1 = tle_lines[i + 1].strip()
-            line2 = tle_lines[i + 2].strip()
-            satellites[name] = EarthSatellite(line1, line2, name, ts)
+        # Only the batched SGP4 path reads these, so plain Satrec objects
+        # are enough; no per-satellite EarthSatellite wrappers
+        starts = range(0, len(tle_lines) - 2, 3)
+        names = [tle_lines[i].strip() for i in starts]
+        keys = [(tle_lines[i + 1].strip(), tle_lines[i + 2].strip()) for i in starts]
+        satrecs = [satrec_by_tle[key] if key in satrec_by_tle else Satrec.twoline2rv(*key) for key in keys]
+        index = {name: i for i, name in enumerate(names)}
+
+        # Only keep the current TLE set so the memo can't grow without bound
+        satrec_by_tle = dict(zip(keys, satrecs))
 
-        print(f"Loaded {len(satellites)} satellites.")
+        catalog = {
+            'array': SatrecArray(satrecs),
+            'index': index,
+            'options_html': Markup("".join(
+                f'<option value="{escape(name)}">{escape(name)}</option>' for name in index
+            ))
+        }
+        print(f"Loaded {len(satrecs)} satellites.")
     except Exception as e:
         print(f"Error loading TLE data: {e}")
 
 
-@app.route("/")
-def index():
-    """Render the main web page."""
-    satellite_names = list(satellites.keys())
-    return render_template_string("""
+def refresh_tle_data_forever():
+    """Refetch TLE data in the background so requests never wait on CelesTrak."""
+    while True:
+        time.sleep(TLE_REFRESH_INTERVAL.total_seconds())
+        load_tle_data()
+
+
+def start_tle_refresh():
+    """Load TLE data once, then keep it fresh from a daemon thread."""
+    load_tle_data()
+    threading.Thread(target=refresh_tle_data_forever, daemon=True).start()
+
+
+def current_positions(cat):
+    """Propagate every satellite in the catalog to the current second in one SGP4 call.
+
+    The result is cached for the rest of the second, so concurrent clients
+    polling different satellites share a single batched propagation.
+    """
+    second = datetime.now(timezone.utc).replace(microsecond=0)
+    entry = position_cache['entry']
+    if entry and entry[0] is cat and entry[1] == second:
+        return entry[2]
+
+    jd, fr = jday(second.year, second.month, second.day, second.hour, second.minute, second.second)
+    e, r, _ = cat['array'].sgp4(np.array([jd]), np.array([fr]))
+    theta, _ = theta_GMST1982(jd, fr)
+    lat, lon, alt = teme_to_subpoint(r[:, 0, :], theta)
+    positions = {
+        'latitude': lat,
+        'longitude': lon,
+        'altitude': alt,
+        'error': e[:, 0]
+    }
+
+    position_cache['entry'] = (cat, second, positions)
+    return positions
+
+
+# Main page, compiled once at import rather than on every request
+INDEX_TEMPLATE = app.jinja_env.from_string("""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -204,9 +287,7 @@ def index():
         <div class="controls">
             <label for="satellite">Select Satellite:</label>
             <select id="satellite">
-                {% for sat in satellites %}
-                    <option value="{{ sat }}">{{ sat }}</option>
-                {% endfor %}
+                {{ options }}
             </select>
             <button onclick="startTracking()">Start Tracking</button>
         </div>
@@ -260,7 +341,13 @@ def index():
         </script>
     </body>
     </html>
-    """, satellites=satellite_names)
+    """)
+
+
+@app.route("/")
+def index():
+    """Render the main web page."""
+    return INDEX_TEMPLATE.render(options=catalog['options_html'])
 
 
 @app.route("/get_position", methods=["POST"])
@@ -269,27 +356,24 @@ def get_position():
     try:
         data = request.get_json()
         satellite_name = data.get("satellite")
-        if not satellite_name or satellite_name not in satellites:
+        cat = catalog
+        if not satellite_name or satellite_name not in cat['index']:
             return jsonify({"error": "Invalid satellite name"}), 400
 
-        satellite = satellites[satellite_name]
-        tle_line1 = satellite.model.line1
-        tle_line2 = satellite.model.line2
-
-        # Use the SGP4 model to get the satellite position
-        from segment1 import get_satellite_position  # Import the function from Segment 1
-
-        lat, lon, alt = get_satellite_position(tle_line1, tle_line2)
+        positions = current_positions(cat)
+        i = cat['index'][satellite_name]
+        if positions['error'][i]:
+            return jsonify({"error": f"SGP4 error code {positions['error'][i]}"}), 500
 
         return jsonify({
-            "latitude": lat,
-            "longitude": lon,
-            "altitude": alt
+            "latitude": float(positions['latitude'][i]),
+            "longitude": float(positions['longitude'][i]),
+            "altitude": float(positions['altitude'][i])
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 if __name__ == "__main__":
-    load_tle_data()
+    start_tle_refresh()
     app.run(debug=True)
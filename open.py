@@ -1,18 +1,40 @@
 import dash
-from dash import dcc, html, dash_table
+from dash import Patch, dcc, html, dash_table
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 from skyfield.api import load, EarthSatellite, wgs84
+from skyfield.sgp4lib import theta_GMST1982
+from sgp4.api import SatrecArray, jday
+from segment1 import EARTH_RADIUS_KM, EARTH_E2, teme_to_subpoint
 from dash.dependencies import Input, Output, State
 import datetime
 from datetime import timedelta
+import functools
 import json
-from dash.exceptions import PreventUpdate
+import math
+import threading
+import time
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the kernels below then run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 # Initialize timescale
 ts = load.timescale()
 
+# Elevation above which a satellite counts as visible, in degrees
+MIN_ELEVATION = 10
+
+# Trail drawn behind each satellite: 20 samples over the last 0.01 days,
+# as day offsets shared by every satellite. The grid ends at 0, so its
+# last sample is the current position.
+TRAIL_OFFSETS = np.linspace(-0.01, 0, 20)
+
 # Enhanced Color Scheme with accessibility considerations
 COLORS = {
     'background': '#FFFFFF',
@@ -28,25 +50,31 @@ COLORS = {
     'success': '#388E3C'  # Success color for confirmations
 }
 
-# Cache for TLE data to avoid frequent reloading
+# Cache for TLE data, refreshed by a background thread. 'data' holds the
+# satellites together with their SatrecArray and is swapped in with one
+# assignment so callbacks always see a matching pair.
 tle_cache = {
     'data': None,
     'timestamp': None,
     'expires_in': timedelta(minutes=15)
 }
 
+# Satellites from the previous load keyed by (name, line1, line2), so a
+# refresh only builds objects for TLEs that actually changed
+satellite_by_tle = {}
 
-def should_refresh_cache():
-    if not tle_cache['timestamp']:
-        return True
-    return datetime.datetime.now() - tle_cache['timestamp'] > tle_cache['expires_in']
-
+# Cache for pass predictions; passes don't change between 5 second ticks
+pass_cache = {
+    'entries': {},
+    'expires_in': timedelta(hours=1)
+}
+# Both Dash callbacks can predict passes at once under a threaded server
+pass_cache_lock = threading.Lock()
 
-def fetch_tle_data():
-    """Fetch TLE data with caching"""
-    if not should_refresh_cache():
-        return tle_cache['data']
 
+def load_satellites():
+    """Build satellite objects from the tracked TLE set, reusing unchanged ones"""
+    global satellite_by_tle
     # Enhanced satellite list including popular satellites
     tle_data = [
         {"name": "International Space Station (ISS)",
@@ -59,63 +87,141 @@ def fetch_tle_data():
     ]
 
     satellites = []
+    loaded = {}
     for sat in tle_data:
+        key = (sat['name'], sat['line1'], sat['line2'])
         try:
-            satellite = EarthSatellite(sat['line1'], sat['line2'], sat['name'])
+            satellite = satellite_by_tle.get(key) or EarthSatellite(sat['line1'], sat['line2'], sat['name'])
             satellites.append(satellite)
+            loaded[key] = satellite
         except Exception as e:
             print(f"Error loading satellite {sat['name']}: {str(e)}")
             continue
 
-    tle_cache['data'] = satellites
-    tle_cache['timestamp'] = datetime.datetime.now()
+    # Only keep the current TLE set so the memo can't grow without bound
+    satellite_by_tle = loaded
     return satellites
 
 
-def calculate_visibility(satellite, observer_lat, observer_lon, min_elevation=10):
-    """Calculate satellite visibility from observer location"""
-    try:
-        location = wgs84.latlon(observer_lat, observer_lon)
-        t = ts.now()
-        pos = satellite.at(t)
-
-        # Calculate elevation angle
-        difference = pos - location.at(t)
-        topocentric = difference.altaz()
-        elevation = topocentric[0].degrees
-
-        return {
-            'visible': elevation > min_elevation,
-            'elevation': round(elevation, 2),
-            'azimuth': round(topocentric[1].degrees, 2)
-        }
-    except:
-        return {'visible': False, 'elevation': 0, 'azimuth': 0}
-
-
-def get_satellite_positions(satellite, times):
-    """Get satellite positions with error handling"""
-    positions = []
-    for t in times:
+def refresh_tle_cache():
+    """Reload the satellites and swap them into the cache"""
+    satellites = load_satellites()
+    tle_cache['data'] = {
+        'satellites': satellites,
+        'array': SatrecArray([sat.model for sat in satellites])
+    }
+    tle_cache['timestamp'] = datetime.datetime.now()
+
+
+def refresh_tle_cache_forever():
+    """Keep the TLE cache fresh outside the callback path"""
+    while True:
+        time.sleep(tle_cache['expires_in'].total_seconds())
         try:
-            pos = satellite.at(t)
-            subpoint = pos.subpoint()
-            positions.append({
-                'lat': subpoint.latitude.degrees,
-                'lon': subpoint.longitude.degrees,
-                'alt': subpoint.elevation.km
-            })
+            refresh_tle_cache()
         except Exception as e:
-            print(f"Error calculating position: {str(e)}")
-            continue
-    return positions
+            print(f"Error refreshing TLE data: {str(e)}")
+
 
+def start_tle_refresh():
+    """Fill the TLE cache, then refresh it from a daemon thread"""
+    refresh_tle_cache()
+    threading.Thread(target=refresh_tle_cache_forever, daemon=True).start()
 
-def get_pass_predictions(satellite, observer_lat, observer_lon, days_ahead=2):
-    """Get detailed pass predictions"""
+
+def fetch_tle_data():
+    """Return the cached satellites and their SatrecArray"""
+    data = tle_cache['data']
+    return data['satellites'], data['array']
+
+
+def propagate_subpoints(satrec_array, jd, fr, theta):
+    """Propagate every satellite over the UTC dates jd + fr in a single SGP4 call.
+
+    theta holds the GMST angle for each time, computed once by the caller.
+    Returns latitude/longitude (degrees), altitude (km), TEME position (km)
+    and velocity (km/s) arrays shaped (n_satellites, n_times, ...).
+    """
+    e, r, v = satrec_array.sgp4(jd, fr)
+    n_sats, n_times = e.shape
+    lat, lon, alt = teme_to_subpoint(r.reshape(-1, 3), np.tile(theta, n_sats))
+
+    return {'lat': lat.reshape(n_sats, n_times), 'lon': lon.reshape(n_sats, n_times),
+            'alt': alt.reshape(n_sats, n_times), 'position': r, 'velocity': v, 'error': e}
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def batch_altaz(r, lat0, lon0, theta):
+    """Elevation and azimuth (degrees) of TEME positions r (n, 3) in km.
+
+    The observer sits on the WGS84 surface at geodetic lat0/lon0
+    (radians); theta is GMST 1982 in radians, which rotates TEME into
+    the Earth-fixed frame.
+    """
+    n = r.shape[0]
+    elevation = np.empty(n)
+    azimuth = np.empty(n)
+
+    sin_lat, cos_lat = math.sin(lat0), math.cos(lat0)
+    sin_lon, cos_lon = math.sin(lon0), math.cos(lon0)
+    sin_theta, cos_theta = math.sin(theta), math.cos(theta)
+
+    # Observer in Earth-fixed coordinates
+    n0 = EARTH_RADIUS_KM / math.sqrt(1.0 - EARTH_E2 * sin_lat * sin_lat)
+    ox = n0 * cos_lat * cos_lon
+    oy = n0 * cos_lat * sin_lon
+    oz = n0 * (1.0 - EARTH_E2) * sin_lat
+
+    for i in prange(n):
+        # TEME -> Earth-fixed, then the range vector from the observer
+        dx = cos_theta * r[i, 0] + sin_theta * r[i, 1] - ox
+        dy = -sin_theta * r[i, 0] + cos_theta * r[i, 1] - oy
+        dz = r[i, 2] - oz
+
+        # Earth-fixed -> local east/north/up
+        east = -sin_lon * dx + cos_lon * dy
+        north = -sin_lat * cos_lon * dx - sin_lat * sin_lon * dy + cos_lat * dz
+        up = cos_lat * cos_lon * dx + cos_lat * sin_lon * dy + sin_lat * dz
+
+        elevation[i] = math.degrees(math.atan2(up, math.sqrt(east * east + north * north)))
+        azimuth[i] = math.degrees(math.atan2(east, north)) % 360.0
+
+    return elevation, azimuth
+
+
+def cache_passes(func):
+    """Memoize pass predictions per satellite, observer location and hour"""
+    @functools.wraps(func)
+    def wrapper(satellite, observer_lat, observer_lon, t0, days_ahead=2):
+        now = datetime.datetime.now()
+        hour_bucket = int(t0.utc_datetime().timestamp() // 3600)
+        key = (satellite.model.satnum, round(observer_lat, 2), round(observer_lon, 2), hour_bucket, days_ahead)
+
+        entries = pass_cache['entries']
+        with pass_cache_lock:
+            entry = entries.get(key)
+        if entry and now - entry['timestamp'] <= pass_cache['expires_in']:
+            # Cached passes can be up to an hour old; skip the ones already over
+            t0_utc = t0.utc_strftime('%Y-%m-%d %H:%M:%S')
+            return [p for p in entry['passes'] if p['set'] >= t0_utc]
+
+        passes = func(satellite, observer_lat, observer_lon, t0, days_ahead)
+
+        with pass_cache_lock:
+            # Drop expired entries so old hour buckets don't pile up
+            for stale in [k for k, v in entries.items() if now - v['timestamp'] > pass_cache['expires_in']]:
+                del entries[stale]
+            entries[key] = {'passes': passes, 'timestamp': now}
+        return passes
+
+    return wrapper
+
+
+@cache_passes
+def get_pass_predictions(satellite, observer_lat, observer_lon, t0, days_ahead=2):
+    """Get detailed pass predictions starting at time t0"""
     try:
         location = wgs84.latlon(observer_lat, observer_lon)
-        t0 = ts.now()
         t1 = t0 + days_ahead
 
         times, events = satellite.find_events(location, t0, t1, altitude_degrees=10)
@@ -142,6 +248,7 @@ def get_pass_predictions(satellite, observer_lat, observer_lon, days_ahead=2):
 
 # Dash app setup
 app = dash.Dash(__name__)
+server = app.server  # WSGI entry point, see wsgi.py
 
 app.layout = html.Div([
     # Enhanced Header
@@ -262,85 +369,113 @@ app.layout = html.Div([
         n_intervals=0
     ),
 
+    # Slower interval for rebuilding the whole globe figure
+    dcc.Interval(
+        id='refresh-interval',
+        interval=60000,  # Rebuild every minute
+        n_intervals=0
+    ),
+
     # Store components for maintaining state
     dcc.Store(id='location-store'),
-    dcc.Store(id='selected-satellite')
+    dcc.Store(id='selected-satellite'),
+    dcc.Store(id='pass-store'),  # Pass predictions from the last globe rebuild
+    dcc.Store(id='trace-store')  # Indices of the trail and marker traces, and the marker count
 ])
 
 
-@app.callback(
-    [Output('globe-view', 'figure'),
-     Output('satellite-table', 'data'),
-     Output('status-panel', 'children'),
-     Output('predictions-panel', 'children')],
-    [Input('interval-component', 'n_intervals'),
-     Input('set-loc', 'n_clicks'),
-     Input('use-location', 'n_clicks')],
-    [State('lat', 'value'),
-     State('lon', 'value'),
-     State('location-store', 'data')]
-)
-def update_displays(n_intervals, set_clicks, gps_clicks, manual_lat, manual_lon, stored_location):
-    ctx = dash.callback_context
-
-    # Determine location source
-    if not ctx.triggered:
-        raise PreventUpdate
-
-    trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
+def compute_tracking_state(lat, lon, known_passes=None):
+    """Propagate every satellite and collect what the displays need for one tick.
 
-    if trigger_id == 'use-location':
-        # Simulate GPS location (replace with actual GPS implementation)
-        lat, lon = 40.7128, -74.0060  # NYC coordinates
-    elif trigger_id == 'set-loc' and manual_lat is not None and manual_lon is not None:
-        lat, lon = manual_lat, manual_lon
-    elif stored_location:
-        lat, lon = stored_location['lat'], stored_location['lon']
-    else:
-        lat, lon = None, None
-
-    # Create enhanced globe visualization
-    fig = go.Figure()
-
-    # Add Earth with improved styling
-    fig.add_trace(go.Scattergeo(
-        lon=np.linspace(-180, 180, 360),
-        lat=np.zeros(360),
-        mode='lines',
-        line=dict(color=COLORS['earth'], width=1),
-        showlegend=False
-    ))
-
-    # Add day/night terminator
-    # (Implementation details omitted for brevity)
-
-    satellites = fetch_tle_data()
+    known_passes maps satellite names to passes predicted earlier; when it is
+    given, the next pass comes from it instead of a new prediction.
+    """
+    satellites, satrec_array = fetch_tle_data()
     satellite_data = []
     visible_sats = []
-
-    for sat in satellites:
+    passes_by_sat = {}
+
+    # Read the clock once per tick and compute GMST for the trail grid here,
+    # so the subpoint and look-angle conversions share it instead of each
+    # going through Skyfield's Time machinery
+    now = datetime.datetime.now(datetime.timezone.utc)
+    jd, fr = jday(now.year, now.month, now.day, now.hour, now.minute,
+                  now.second + now.microsecond / 1e6)
+    jd_grid, fr_grid = np.full(len(TRAIL_OFFSETS), jd), fr + TRAIL_OFFSETS
+    theta, _ = theta_GMST1982(jd_grid, fr_grid)
+    theta_now = theta[-1]
+    t = ts.from_datetime(now)  # Only pass predictions still need a Skyfield Time
+    now_utc = now.strftime('%Y-%m-%d %H:%M:%S')
+
+    # Propagate all satellites over the shared trail grid in one SGP4 call;
+    # the last column of the track is where each satellite is now
+    track = propagate_subpoints(satrec_array, jd_grid, fr_grid, theta)
+    subpoints = {key: track[key][:, -1] for key in ('lat', 'lon', 'alt', 'position', 'velocity', 'error')}
+
+    # Speeds for the table in one reduction rather than a norm per satellite
+    v = subpoints['velocity']
+    speeds = np.sqrt((v * v).sum(axis=1))
+
+    # Look angles in one kernel call, but only for satellites in front of
+    # the observer's horizon plane; anything behind it can't be visible
+    if lat and lon:
+        r = subpoints['position']
+        cos_theta, sin_theta = np.cos(theta_now), np.sin(theta_now)
+        r_ecef = np.column_stack((cos_theta * r[:, 0] + sin_theta * r[:, 1],
+                                  -sin_theta * r[:, 0] + cos_theta * r[:, 1],
+                                  r[:, 2]))
+        obs_ecef = wgs84.latlon(lat, lon).itrs_xyz.km
+        above_horizon = (r_ecef - obs_ecef) @ (obs_ecef / np.linalg.norm(obs_ecef)) > 0
+
+        candidates = np.flatnonzero(above_horizon)
+        elevations = np.full(len(r), np.nan)
+        azimuths = np.full(len(r), np.nan)
+        elevations[candidates], azimuths[candidates] = batch_altaz(r[candidates], math.radians(lat),
+                                                                   math.radians(lon), theta_now)
+
+    # All trails share one trace (None breaks the line between satellites)
+    # and all current positions share another, instead of two traces each
+    trail_lons, trail_lats, trail_colors = [], [], []
+    marker_lons, marker_lats, marker_colors, marker_names = [], [], [], []
+
+    for i, sat in enumerate(satellites):
         try:
-            t = ts.now()
-            pos = sat.at(t)
-            subpoint = pos.subpoint()
+            if subpoints['error'][i]:
+                raise ValueError(f"SGP4 error code {subpoints['error'][i]}")
+            sat_lat = subpoints['lat'][i]
+            sat_lon = subpoints['lon'][i]
 
             # Calculate visibility
-            visibility = calculate_visibility(sat, lat, lon) if lat and lon else {'visible': False, 'elevation': 0,
-                                                                                  'azimuth': 0}
+            if lat and lon and above_horizon[i]:
+                visibility = {
+                    'visible': elevations[i] > MIN_ELEVATION,
+                    'elevation': round(float(elevations[i]), 2),
+                    'azimuth': round(float(azimuths[i]), 2)
+                }
+            elif lat and lon:
+                visibility = {'visible': False, 'elevation': None, 'azimuth': None}
+            else:
+                visibility = {'visible': False, 'elevation': 0, 'azimuth': 0}
 
             # Get pass predictions
-            passes = get_pass_predictions(sat, lat, lon) if lat and lon else []
+            if not (lat and lon):
+                passes = []
+            elif known_passes is not None:
+                passes = [p for p in known_passes.get(sat.name, []) if p['set'] >= now_utc]
+            else:
+                passes = get_pass_predictions(sat, lat, lon, t)
+            passes_by_sat[sat.name] = passes
             next_pass = passes[0]['rise'] if passes else "No upcoming passes"
 
             # Add to satellite data
             sat_entry = {
                 'Satellite Name': sat.name.strip(),
-                'Latitude': round(subpoint.latitude.degrees, 2),
-                'Longitude': round(subpoint.longitude.degrees, 2),
-                'Altitude (km)': round(subpoint.elevation.km, 2),
-                'Speed (km/s)': round(np.linalg.norm(pos.velocity.km_per_s), 2),
+                'Latitude': round(float(sat_lat), 2),
+                'Longitude': round(float(sat_lon), 2),
+                'Altitude (km)': round(float(subpoints['alt'][i]), 2),
+                'Speed (km/s)': round(float(speeds[i]), 2),
                 'Visible': 'Yes' if visibility['visible'] else 'No',
-                'Elevation': f"{visibility['elevation']}°",
+                'Elevation': f"{visibility['elevation']}°" if visibility['elevation'] is not None else "Below horizon",
                 'Next Pass': next_pass
             }
             satellite_data.append(sat_entry)
@@ -349,46 +484,70 @@ def update_displays(n_intervals, set_clicks, gps_clicks, manual_lat, manual_lon,
                 visible_sats.append(sat.name.strip())
 
             # Add satellite trail
-            trail_positions = get_satellite_positions(sat, ts.linspace(t - 0.01, t, 20))
-
-            fig.add_trace(go.Scattergeo(
-                lon=[pos['lon'] for pos in trail_positions],
-                lat=[pos['lat'] for pos in trail_positions],
-                mode='lines+markers',
-                line=dict(
-                    color=COLORS['trail' if not visibility['visible'] else 'success'],
-                    width=2,
-                    dash='dot'
-                ),
-                marker=dict(size=3),
-                name=f"{sat.name} Trail"
-            ))
+            trail_lons.extend(track['lon'][i].tolist() + [None])
+            trail_lats.extend(track['lat'][i].tolist() + [None])
+            trail_color = COLORS['trail' if not visibility['visible'] else 'success']
+            trail_colors.extend([trail_color] * (len(TRAIL_OFFSETS) + 1))
 
             # Add current position
-            fig.add_trace(go.Scattergeo(
-                lon=[subpoint.longitude.degrees],
-                lat=[subpoint.latitude.degrees],
-                mode='markers+text',
-                marker=dict(
-                    size=10,
-                    color=COLORS['success' if visibility['visible'] else 'accent']
-                ),
-                text=[sat.name],
-                textposition="top center",
-                name=sat.name
-            ))
+            marker_lons.append(float(sat_lon))
+            marker_lats.append(float(sat_lat))
+            marker_colors.append(COLORS['success' if visibility['visible'] else 'accent'])
+            marker_names.append(sat.name)
 
         except Exception as e:
             print(f"Error processing satellite {sat.name}: {str(e)}")
             continue
 
+    return {
+        'satellites': satellites,
+        'table': satellite_data,
+        'visible': visible_sats,
+        'passes': passes_by_sat,
+        'trail': {'lon': trail_lons, 'lat': trail_lats, 'color': trail_colors},
+        'markers': {'lon': marker_lons, 'lat': marker_lats, 'color': marker_colors, 'text': marker_names}
+    }
+
+
+def build_globe_figure(state, lat, lon):
+    """Build the globe figure, returning it with the trail and marker trace indices"""
+    # WebGL map traces over raster tiles; the browser no longer builds an
+    # SVG path per point as it did for the orthographic Scattergeo globe
+    fig = go.Figure()
+
+    # Add day/night terminator
+    # (Implementation details omitted for brevity)
+
+    trace_indices = {'trail': len(fig.data), 'markers': len(fig.data) + 1,
+                     'count': len(state['markers']['lon'])}
+
+    fig.add_trace(go.Scattermap(
+        lon=state['trail']['lon'],
+        lat=state['trail']['lat'],
+        mode='lines+markers',
+        connectgaps=False,
+        line=dict(color=COLORS['trail'], width=2),
+        marker=dict(size=3, color=state['trail']['color']),
+        name="Trails"
+    ))
+
+    fig.add_trace(go.Scattermap(
+        lon=state['markers']['lon'],
+        lat=state['markers']['lat'],
+        mode='markers+text',
+        marker=dict(size=10, color=state['markers']['color']),
+        text=state['markers']['text'],
+        textposition="top center",
+        name="Satellites"
+    ))
+
     # Add observer location if available
     if lat is not None and lon is not None:
-        fig.add_trace(go.Scattergeo(
+        fig.add_trace(go.Scattermap(
             lon=[lon],
             lat=[lat],
             mode='markers+text',
-            marker=dict(size=12, color=COLORS['highlight'], symbol='star'),
+            marker=dict(size=12, color=COLORS['highlight']),
             text=['Observer Location'],
             textposition="bottom center",
             name='Your Location'
@@ -396,16 +555,10 @@ def update_displays(n_intervals, set_clicks, gps_clicks, manual_lat, manual_lon,
 
     # Update layout with enhanced styling
     fig.update_layout(
-        geo=dict(
-            projection_type="orthographic",
-            showland=True,
-            showocean=True,
-            landcolor='lightgray',
-            oceancolor='rgb(230, 230, 250)',
-            coastlinecolor='gray',
-            coastlinewidth=0.5,
-            lataxis={'showgrid': True, 'gridcolor': 'lightgray'},
-            lonaxis={'showgrid': True, 'gridcolor': 'lightgray'}
+        map=dict(
+            style='carto-positron',
+            center=dict(lat=lat or 0, lon=lon or 0),
+            zoom=0.6
         ),
         showlegend=True,
         legend=dict(
@@ -420,20 +573,46 @@ def update_displays(n_intervals, set_clicks, gps_clicks, manual_lat, manual_lon,
         margin=dict(l=0, r=0, t=0, b=0),
         paper_bgcolor=COLORS['background'],
         plot_bgcolor=COLORS['background'],
-        height=600
+        height=600,
+        uirevision='globe'  # Keep the user's pan/zoom across rebuilds
     )
 
-    # Create status panel content
-    status_panel = html.Div([
-        html.H3("Current Status", style={'color': COLORS['text']}),
-        html.Div([
-                     html.P(
-                         f"Observer Location: {lat:.2f}°N, {lon:.2f}°E" if lat and lon else "Observer location not set",
-                         style={'color': COLORS['text']}),
-                     html.P(f"Visible Satellites: {len(visible_sats)}", style={'color': COLORS['text']}),
-                     html.Ul([html.Li(sat) for sat in visible_sats], style={'color': COLORS['success']})
-                 ] if lat and lon else [])
-    ])
+    return fig, trace_indices
+
+
+@app.callback(
+    [Output('globe-view', 'figure'),
+     Output('predictions-panel', 'children'),
+     Output('location-store', 'data'),
+     Output('pass-store', 'data'),
+     Output('trace-store', 'data')],
+    [Input('refresh-interval', 'n_intervals'),
+     Input('set-loc', 'n_clicks'),
+     Input('use-location', 'n_clicks')],
+    [State('lat', 'value'),
+     State('lon', 'value'),
+     State('location-store', 'data')]
+)
+def update_displays(n_intervals, set_clicks, gps_clicks, manual_lat, manual_lon, stored_location):
+    """Rebuild the globe and pass predictions; per-tick positions come from update_positions"""
+    ctx = dash.callback_context
+
+    # Determine location source; the initial call on page load has no
+    # trigger and builds the globe from the stored location, if any
+    trigger_id = ctx.triggered[0]['prop_id'].split('.')[0] if ctx.triggered else None
+
+    if trigger_id == 'use-location':
+        # Simulate GPS location (replace with actual GPS implementation)
+        lat, lon = 40.7128, -74.0060  # NYC coordinates
+    elif trigger_id == 'set-loc' and manual_lat is not None and manual_lon is not None:
+        lat, lon = manual_lat, manual_lon
+    elif stored_location:
+        lat, lon = stored_location['lat'], stored_location['lon']
+    else:
+        lat, lon = None, None
+
+    state = compute_tracking_state(lat, lon)
+    fig, trace_indices = build_globe_figure(state, lat, lon)
 
     # Create predictions panel content
     predictions_panel = html.Div([
@@ -453,17 +632,74 @@ def update_displays(n_intervals, set_clicks, gps_clicks, manual_lat, manual_lon,
                                  html.Td(pass_data['max']),
                                  html.Td(pass_data['set']),
                                  html.Td(pass_data['duration'])
-                             ]) for pass_data in get_pass_predictions(sat, lat, lon)]
+                             ]) for pass_data in state['passes'].get(sat.name, [])]
                          ], style={'width': '100%', 'marginBottom': '20px'})
-                     ]) for sat in satellites
+                     ]) for sat in state['satellites']
                  ] if lat and lon else [
             html.P("Set observer location to view pass predictions",
                    style={'color': COLORS['warning']})
         ])
     ])
 
-    return fig, satellite_data, status_panel, predictions_panel
+    location = {'lat': lat, 'lon': lon} if lat is not None and lon is not None else None
+    return fig, predictions_panel, location, state['passes'], trace_indices
+
+
+@app.callback(
+    [Output('satellite-table', 'data'),
+     Output('status-panel', 'children'),
+     Output('globe-view', 'figure', allow_duplicate=True),
+     Output('trace-store', 'data', allow_duplicate=True)],
+    [Input('interval-component', 'n_intervals'),
+     Input('location-store', 'data')],
+    [State('pass-store', 'data'),
+     State('trace-store', 'data')],
+    prevent_initial_call='initial_duplicate'
+)
+def update_positions(n_intervals, stored_location, stored_passes, trace_indices):
+    """Per-tick update: table, status panel and a patch of the globe's trail and markers"""
+    lat, lon = (stored_location['lat'], stored_location['lon']) if stored_location else (None, None)
+    # Passes come from the last rebuild; predicting them is left to update_displays
+    state = compute_tracking_state(lat, lon, stored_passes or {})
+    visible_sats = state['visible']
+
+    # Create status panel content
+    status_panel = html.Div([
+        html.H3("Current Status", style={'color': COLORS['text']}),
+        html.Div([
+                     html.P(
+                         f"Observer Location: {lat:.2f}°N, {lon:.2f}°E" if lat and lon else "Observer location not set",
+                         style={'color': COLORS['text']}),
+                     html.P(f"Visible Satellites: {len(visible_sats)}", style={'color': COLORS['text']}),
+                     html.Ul([html.Li(sat) for sat in visible_sats], style={'color': COLORS['success']})
+                 ] if lat and lon else [])
+    ])
+
+    if not trace_indices:
+        # The globe isn't built yet; update_displays draws it on page load
+        return state['table'], status_panel, dash.no_update, dash.no_update
+    if trace_indices['count'] != len(state['markers']['lon']):
+        # The satellite set changed size (e.g. a TLE refresh), so rebuild the
+        # whole globe rather than patch arrays that no longer line up
+        fig, trace_indices = build_globe_figure(state, lat, lon)
+        return state['table'], status_panel, fig, trace_indices
+
+    # Replace every per-point array of the two moving traces, so positions,
+    # visibility colors and labels all come from the same tick
+    fig = Patch()
+    trail = fig['data'][trace_indices['trail']]
+    trail['lon'] = state['trail']['lon']
+    trail['lat'] = state['trail']['lat']
+    trail['marker']['color'] = state['trail']['color']
+    markers = fig['data'][trace_indices['markers']]
+    markers['lon'] = state['markers']['lon']
+    markers['lat'] = state['markers']['lat']
+    markers['marker']['color'] = state['markers']['color']
+    markers['text'] = state['markers']['text']
+
+    return state['table'], status_panel, fig, dash.no_update
 
 
 if __name__ == '__main__':
+    start_tle_refresh()
     app.run_server(debug=True, host='0.0.0.0', port=8050)
@@ -1,64 +1,232 @@
-from sgp4.api import Satrec, jday
+from sgp4.api import Satrec, SatrecArray, jday
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
+import math
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; eci_to_lla then uses its NumPy path
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# WGS84 ellipsoid, shared by SatelliteTracker and the app.py / open.py trackers
+EARTH_RADIUS_KM = 6378.137  # Equatorial radius
+EARTH_E2 = 0.08181919 ** 2  # Eccentricity squared
+
+# Most ground tracks SatelliteTracker keeps between visualization calls
+TRACK_CACHE_SIZE = 128
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _eci_to_lla_kernel(x, y, z, gst, e2, a):
+    """Closed-form ECI -> geodetic conversion, one point per loop iteration.
+
+    Same math as _eci_to_lla_numpy: gst is in degrees, and lat/lon come
+    back in degrees with alt in km.
+    """
+    n = x.shape[0]
+    lat = np.empty(n)
+    lon = np.empty(n)
+    alt = np.empty(n)
+
+    b2 = a * a * (1.0 - e2)
+    ep2 = (a * a - b2) / b2
+    two_pi = 2.0 * math.pi
+
+    for i in prange(n):
+        lon_rad = (math.atan2(y[i], x[i]) - math.radians(gst[i])) % two_pi
+
+        p2 = x[i] * x[i] + y[i] * y[i]
+        p = math.sqrt(p2)
+        zz = z[i] * z[i]
+        F = 54.0 * b2 * zz
+        G = p2 + (1.0 - e2) * zz - e2 * (a * a - b2)
+        c = e2 * e2 * F * p2 / (G * G * G)
+        s = (1.0 + c + math.sqrt(c * c + 2.0 * c)) ** (1.0 / 3.0)
+        k = s + 1.0 / s + 1.0
+        P = F / (3.0 * k * k * G * G)
+        Q = math.sqrt(1.0 + 2.0 * e2 * e2 * P)
+        r0 = (-P * e2 * p / (1.0 + Q)
+              + math.sqrt(a * a / 2.0 * (1.0 + 1.0 / Q) - P * (1.0 - e2) * zz / (Q * (1.0 + Q)) - P * p2 / 2.0))
+        d = p - e2 * r0
+        U = math.sqrt(d * d + zz)
+        V = math.sqrt(d * d + (1.0 - e2) * zz)
+        z0 = b2 * z[i] / (a * V)
+
+        lat[i] = math.degrees(math.atan2(z[i] + ep2 * z0, p))
+        lon[i] = math.degrees(lon_rad)
+        alt[i] = U * (1.0 - b2 / (a * V))
+
+    return lat, lon, alt
+
+
+def _eci_to_lla_numpy(x, y, z, gst, e2, a):
+    """NumPy fallback for _eci_to_lla_kernel when Numba is not installed."""
+    # Longitude calculation
+    lon = np.remainder(np.arctan2(y, x) - np.radians(gst), 2 * np.pi)
+
+    # Latitude and altitude calculation (closed form, Heikkinen 1982).
+    # Squares shared between terms are computed once, and scalar factors
+    # are grouped ahead of the arrays so each product is one array pass
+    one_minus_e2 = 1 - e2
+    ep2 = e2 / one_minus_e2  # Second eccentricity squared
+    a2 = a * a
+    b2 = a2 * one_minus_e2
+    zz = z * z
+    p = np.hypot(x, y)
+    p2 = p * p
+    F = 54 * b2 * zz
+    G = p2 + one_minus_e2 * zz - e2 * (a2 - b2)
+    GG = G * G
+    c = e2 * e2 * F * p2 / (GG * G)
+    s = np.cbrt(1 + c + np.sqrt(c * c + 2 * c))
+    k = s + 1 / s + 1
+    P = F / (3 * k * k * GG)
+    Q = np.sqrt(1 + 2 * e2 * e2 * P)
+    r0 = (-e2 * P * p / (1 + Q)
+          + np.sqrt(a2 / 2 * (1 + 1 / Q) - one_minus_e2 * P * zz / (Q * (1 + Q)) - P * p2 / 2))
+    d = p - e2 * r0
+    dd = d * d
+    U = np.sqrt(dd + zz)
+    V = np.sqrt(dd + one_minus_e2 * zz)
+    b2_over_aV = b2 / (a * V)  # z0 / z
+
+    lat = np.arctan2(z + ep2 * b2_over_aV * z, p)
+    alt = U * (1 - b2_over_aV)
+
+    return np.degrees(lat), np.degrees(lon), alt
+
+
+def teme_to_subpoint(r, theta):
+    """Geodetic subpoint of TEME positions r (n, 3) in km, given GMST theta in radians.
+
+    Rotating TEME by GMST 1982 gives the Earth-fixed frame SGP4 assumes, so
+    this is the same conversion SatelliteTracker.eci_to_lla runs, with
+    longitude wrapped to [-180, 180).
+    """
+    r = np.asarray(r, dtype=float)
+    gst = np.broadcast_to(np.degrees(theta), r.shape[:1])
+    convert = _eci_to_lla_kernel if HAVE_NUMBA else _eci_to_lla_numpy
+    lat, lon, alt = convert(r[:, 0], r[:, 1], r[:, 2], gst, EARTH_E2, EARTH_RADIUS_KM)
+    lon = (lon + 180.0) % 360.0 - 180.0
+
+    return lat, lon, alt
 
 
 class SatelliteTracker:
     def __init__(self):
-        self.earth_radius = 6378.137  # Earth's radius in km
-        self.e2 = 0.08181919 ** 2  # Earth's eccentricity squared
-
-    def eci_to_lla(self, r, gst):
-        """Convert Earth-Centered Inertial (ECI) coordinates to Lat/Lon/Alt."""
-        x, y, z = r
-
-        # Longitude calculation
-        lon = np.arctan2(y, x) - np.deg2rad(gst)
-
-        # Latitude calculation (iterative solution)
-        p = np.sqrt(x ** 2 + y ** 2)
-        lat = np.arctan2(z, p * (1 - self.e2))
-        for _ in range(5):
-            sin_lat = np.sin(lat)
-            lat = np.arctan2(z + self.e2 * self.earth_radius * sin_lat, p)
-
-        # Altitude calculation
-        sin_lat = np.sin(lat)
-        N = self.earth_radius / np.sqrt(1 - self.e2 * sin_lat ** 2)
-        alt = p / np.cos(lat) - N
-
-        return np.degrees(lat), np.degrees(lon) % 360, alt
+        self.earth_radius = EARTH_RADIUS_KM  # Earth's radius in km
+        self.e2 = EARTH_E2  # Earth's eccentricity squared
+        self.polar_radius = self.earth_radius * np.sqrt(1 - self.e2)  # Earth's polar radius in km
+        # (line1, line2, start_time, duration_hours, step_minutes) -> (positions, times)
+        self.track_cache = {}
+
+    def eci_to_lla(self, r_eci, gst):
+        """Convert Earth-Centered Inertial (ECI) coordinates to Lat/Lon/Alt.
+
+        r_eci is an (N, 3) array of positions in km and gst the matching
+        (N,) array of Greenwich sidereal times in degrees.
+        """
+        r_eci = np.asarray(r_eci, dtype=float)
+        r = np.atleast_2d(r_eci)
+        gst = np.broadcast_to(np.asarray(gst, dtype=float), r.shape[:1])
+        convert = _eci_to_lla_kernel if HAVE_NUMBA else _eci_to_lla_numpy
+        lat, lon, alt = convert(r[:, 0], r[:, 1], r[:, 2], gst, self.e2, self.earth_radius)
+
+        if r_eci.ndim == 1:
+            return lat[0], lon[0], alt[0]
+        return lat, lon, alt
 
     def calculate_ground_track(self, satellite, start_time, duration_hours=24, step_minutes=10):
         """Calculate satellite ground track over time."""
-        positions = []
-        times = []
-
-        for minutes in range(0, duration_hours * 60, step_minutes):
-            current_time = start_time + timedelta(minutes=minutes)
-            jd, fr = jday(current_time.year, current_time.month, current_time.day,
-                          current_time.hour, current_time.minute, current_time.second)
-
-            # Calculate GST
-            gst = (jd + fr - 2451545.0) / 36525.0 * 360.0
-            gst %= 360.0
-
-            # Get satellite position
-            e, r, v = satellite.sgp4(jd, fr)
-
-            if e == 0:  # Successful computation
-                lat, lon, alt = self.eci_to_lla(r, gst)
-                positions.append((lat, lon, alt))
-                times.append(current_time)
-
-        return positions, times
+        return self.calculate_ground_tracks([satellite], start_time, duration_hours, step_minutes)[0]
+
+    def calculate_ground_tracks(self, satellites, start_time, duration_hours=24, step_minutes=10):
+        """Calculate ground tracks for several satellites over a shared time grid.
+
+        Returns one (positions, times) pair per satellite, in order, with
+        positions as float32 lat/lon/alt rows.
+        """
+        minutes = np.arange(0, duration_hours * 60, step_minutes)
+
+        # One jday call for the start, then step in days; the whole days are
+        # carried into jd so fr stays a small fraction for sgp4's precision
+        jd0, fr0 = jday(start_time.year, start_time.month, start_time.day,
+                        start_time.hour, start_time.minute, start_time.second)
+        fr = fr0 + minutes / 1440.0
+        whole_days = np.floor(fr)
+        jd = jd0 + whole_days
+        fr -= whole_days
+
+        positions, e = self.propagate_to_lla(satellites, jd, fr)
+        ok = e == 0  # Successful computation
+
+        # Tracks are only drawn, so float32 (~3 m at 360 degrees) is plenty
+        # and halves what is kept in the cache and serialized for plotly
+        positions = positions.astype(np.float32)
+        times = pd.date_range(start_time, periods=len(minutes), freq=f'{step_minutes}min')
+
+        return [(positions[i][ok[i]], times[ok[i]]) for i in range(len(satellites))]
+
+    def propagate_to_lla(self, satellites, jd, fr):
+        """Propagate Satrec objects over the dates jd + fr straight to Lat/Lon/Alt.
+
+        Both steps stay in compiled loops: sgp4's C++ SatrecArray, then the
+        Numba conversion kernel when it is available. Returns an (M, N, 3)
+        array of lat/lon (degrees) and alt (km) rows, and the (M, N) SGP4
+        error codes.
+        """
+        # Calculate GST for the whole time grid
+        gst = np.remainder((jd + fr - 2451545.0) / 36525.0 * 360.0, 360.0)
+
+        # Get every satellite's positions at every timestep in one call; r is (M, N, 3)
+        e, r, v = SatrecArray(satellites).sgp4(jd, fr)
+
+        # Convert all M * N positions at once, then split back per satellite
+        lat, lon, alt = self.eci_to_lla(r.reshape(-1, 3), np.tile(gst, len(satellites)))
+        return np.column_stack((lat, lon, alt)).reshape(r.shape), e
+
+    def cached_ground_tracks(self, tle_list, start_time, duration_hours=24, step_minutes=10):
+        """Ground tracks for TLE line pairs, propagating only the ones not cached yet.
+
+        The cache is least-recently-used: a hit moves its entry to the end,
+        and cached arrays are read-only since they are shared between calls.
+        """
+        keys = [(tle[0], tle[1], start_time, duration_hours, step_minutes) for tle in tle_list]
+        tracks = {}
+        for key in dict.fromkeys(keys):
+            if key in self.track_cache:
+                tracks[key] = self.track_cache[key] = self.track_cache.pop(key)
+
+        missing = [key for key in dict.fromkeys(keys) if key not in tracks]
+        if missing:
+            satellites = [Satrec.twoline2rv(key[0], key[1]) for key in missing]
+            computed = self.calculate_ground_tracks(satellites, start_time, duration_hours, step_minutes)
+            for positions, _ in computed:
+                positions.flags.writeable = False
+            tracks.update(zip(missing, computed))
+            self.track_cache.update(zip(missing, computed))
+
+            # Drop the least recently used entries once over the limit
+            while len(self.track_cache) > TRACK_CACHE_SIZE:
+                del self.track_cache[next(iter(self.track_cache))]
+
+        return [tracks[key] for key in keys]
 
     def is_visible(self, sat_lla, ground_station_lla, min_elevation=10):
-        """Determine if satellite is visible from ground station."""
-        sat_lat, sat_lon, sat_alt = sat_lla
+        """Determine if satellites are visible from ground station.
+
+        sat_lla is an (N, 3) array of lat/lon (degrees) and alt (km) rows,
+        e.g. a whole ground track; returns (N,) visibility and elevation arrays.
+        """
+        sat_lat, sat_lon, sat_alt = np.asarray(sat_lla, dtype=float).T
         gs_lat, gs_lon, _ = ground_station_lla
 
         # Convert to radians
@@ -85,7 +253,8 @@ class SatelliteTracker:
                 ("Guiana Space Centre", 5.2322, -52.7693)
             ]
 
-        now = datetime.utcnow()
+        # Start on the minute so re-renders within it reuse the cached tracks
+        now = datetime.utcnow().replace(second=0, microsecond=0)
 
         # Create figure with secondary y-axis
         fig = make_subplots(rows=2, cols=1,
@@ -110,16 +279,15 @@ class SatelliteTracker:
             lonaxis_showgrid=True
         )
 
-        # Process each satellite
-        for i, tle in enumerate(tle_list):
-            satellite = Satrec.twoline2rv(tle[0], tle[1])
-            positions, times = self.calculate_ground_track(satellite, now)
-
+        # Propagate all uncached satellites together, then process each one
+        tracks = self.cached_ground_tracks(tle_list, now)
+        traces, rows = [], []
+        for i, (positions, times) in enumerate(tracks):
             # Separate positions into components
-            lats, lons, alts = zip(*positions)
+            lats, lons, alts = positions.T
 
             # Add current position
-            fig.add_trace(
+            traces.append(
                 go.Scattergeo(
                     lat=[lats[0]],
                     lon=[lons[0]],
@@ -129,12 +297,12 @@ class SatelliteTracker:
                     marker=dict(size=10, symbol='diamond'),
                     name=f"Satellite {i + 1} (Current)",
                     showlegend=True
-                ),
-                row=1, col=1
+                )
             )
+            rows.append(1)
 
             # Add ground track
-            fig.add_trace(
+            traces.append(
                 go.Scattergeo(
                     lat=lats,
                     lon=lons,
@@ -142,25 +310,25 @@ class SatelliteTracker:
                     line=dict(width=1, dash='dot'),
                     name=f"Satellite {i + 1} Ground Track",
                     showlegend=True
-                ),
-                row=1, col=1
+                )
             )
+            rows.append(1)
 
             # Add altitude plot
-            time_differences = [(t - now).total_seconds() / 3600 for t in times]
-            fig.add_trace(
-                go.Scatter(
+            time_differences = ((times - now).total_seconds() / 3600).astype(np.float32)
+            traces.append(
+                go.Scattergl(
                     x=time_differences,
                     y=alts,
                     name=f"Satellite {i + 1} Altitude",
                     mode='lines'
-                ),
-                row=2, col=1
+                )
             )
+            rows.append(2)
 
         # Add ground stations
         for name, lat, lon in ground_stations:
-            fig.add_trace(
+            traces.append(
                 go.Scattergeo(
                     lat=[lat],
                     lon=[lon],
@@ -170,9 +338,12 @@ class SatelliteTracker:
                     marker=dict(size=8, symbol='star'),
                     name=f"Ground Station: {name}",
                     showlegend=True
-                ),
-                row=1, col=1
+                )
             )
+            rows.append(1)
+
+        # Add every trace in one call instead of validating them one at a time
+        fig.add_traces(traces, rows=rows, cols=[1] * len(traces))
 
         # Update layout
         fig.update_layout(
@@ -0,0 +1,70 @@
+import math
+import unittest
+from unittest import mock
+
+import numpy as np
+from skyfield.api import wgs84
+
+import segment1
+from segment1 import SatelliteTracker, teme_to_subpoint
+
+# Geodetic lat/lon (degrees) and altitude (km): ISS-like and polar LEO,
+# a GPS-like MEO and a geostationary point
+POINTS = np.array([
+    [51.64, -74.00, 420.0],
+    [-89.50, 10.00, 800.0],
+    [45.00, 170.00, 20200.0],
+    [0.00, 75.00, 35786.0],
+])
+
+# Greenwich sidereal time for each point, in degrees
+GST = np.array([0.0, 100.0, 215.5, 359.0])
+
+
+def inertial_vectors():
+    """Skyfield's WGS84 Earth-fixed positions for POINTS, rotated by GST into ECI."""
+    ecef = np.array([wgs84.latlon(lat, lon, elevation_m=alt * 1000).itrs_xyz.km for lat, lon, alt in POINTS])
+    gst = np.radians(GST)
+    cos_gst, sin_gst = np.cos(gst), np.sin(gst)
+    return np.column_stack((cos_gst * ecef[:, 0] - sin_gst * ecef[:, 1],
+                            sin_gst * ecef[:, 0] + cos_gst * ecef[:, 1],
+                            ecef[:, 2]))
+
+
+class GeodeticConversionTest(unittest.TestCase):
+    def assert_matches_skyfield(self, lat, lon, alt):
+        np.testing.assert_allclose(lat, POINTS[:, 0], atol=1e-6)
+        np.testing.assert_allclose((lon - POINTS[:, 1] + 180) % 360 - 180, 0, atol=1e-6)
+        np.testing.assert_allclose(alt, POINTS[:, 2], atol=1e-5)
+
+    def test_eci_to_lla(self):
+        lat, lon, alt = SatelliteTracker().eci_to_lla(inertial_vectors(), GST)
+        self.assert_matches_skyfield(lat, lon, alt)
+
+    def test_eci_to_lla_numpy_path(self):
+        with mock.patch.object(segment1, 'HAVE_NUMBA', False):
+            lat, lon, alt = SatelliteTracker().eci_to_lla(inertial_vectors(), GST)
+        self.assert_matches_skyfield(lat, lon, alt)
+
+    def test_eci_to_lla_single_vector(self):
+        lat, lon, alt = SatelliteTracker().eci_to_lla(inertial_vectors()[0], GST[0])
+        self.assertAlmostEqual(lat, POINTS[0, 0], places=6)
+        self.assertAlmostEqual(lon - 360, POINTS[0, 1], places=6)
+        self.assertAlmostEqual(alt, POINTS[0, 2], places=5)
+
+    def test_teme_to_subpoint(self):
+        for have_numba in (segment1.HAVE_NUMBA, False):
+            with mock.patch.object(segment1, 'HAVE_NUMBA', have_numba):
+                lat, lon, alt = teme_to_subpoint(inertial_vectors(), np.radians(GST))
+            self.assert_matches_skyfield(lat, lon, alt)
+            self.assertTrue(np.all((lon >= -180) & (lon < 180)))
+
+    def test_teme_to_subpoint_scalar_theta(self):
+        r = inertial_vectors()[:1]
+        lat, lon, alt = teme_to_subpoint(r, math.radians(GST[0]))
+        self.assertAlmostEqual(lat[0], POINTS[0, 0], places=6)
+        self.assertAlmostEqual(lon[0], POINTS[0, 1], places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+"""WSGI entry points for serving the trackers with gunicorn and gevent workers.
+
+Flask tracker (app.py):
+    gunicorn -k gevent -w 4 --worker-connections 1000 "wsgi:tracker()"
+
+Dash dashboard (open.py):
+    gunicorn -k gevent -w 4 --worker-connections 1000 "wsgi:dashboard()"
+"""
+from gevent import monkey
+
+# Patch the stdlib before anything imports sockets, ssl or threading so
+# requests and the TLE refresh threads cooperate with the gevent hub
+monkey.patch_all()
+
+
+def tracker():
+    """Return the Flask tracker with its TLE refresh running."""
+    from app import app, start_tle_refresh
+
+    start_tle_refresh()
+    return app
+
+
+def dashboard():
+    """Return the Dash dashboard's Flask server with its TLE refresh running."""
+    from open import server, start_tle_refresh
+
+    start_tle_refresh()
+    return server